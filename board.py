@@ -32,6 +32,16 @@ class Board:
             return True
         return False
 
+    def remove_stone(self, row: int, col: int):
+        """
+        盤面の指定した位置の石を取り除きます。
+
+        Args:
+            row (int): 石を取り除く行。
+            col (int): 石を取り除く列。
+        """
+        self.grid[row][col] = None
+
     def observe_and_check_winner(self, observer_player_type: int) -> Optional[int]:
         """
         盤面全体を観測し、勝利判定を行います。
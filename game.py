@@ -0,0 +1,103 @@
+from config import PLAYER_BLACK, PLAYER_WHITE
+from board import Board
+from player import Player
+from history import MoveHistory, MoveNode, MOVE_PLACE, MOVE_OBSERVE
+
+class GameState:
+    """
+    盤面・プレイヤー・手順履歴をまとめて管理するクラス。
+
+    手の適用（make）と取り消し（unmake）はすべてここで行い、
+    描画や入力処理には依存しません。
+    """
+    def __init__(self):
+        self.board = Board()
+        self.players = [Player(PLAYER_BLACK), Player(PLAYER_WHITE)]
+        self.current_player_index = 0
+        self.history = MoveHistory()
+
+    def place_stone(self, row: int, col: int) -> bool:
+        """
+        手番のプレイヤーの石を置き、履歴に記録します。
+
+        Args:
+            row (int): 石を置く行。
+            col (int): 石を置く列。
+
+        Returns:
+            bool: 置けた場合はTrue。
+        """
+        player_index = self.current_player_index
+        stone_id = self.players[player_index].get_next_stone_id()
+        if not self._make(MOVE_PLACE, player_index, row, col, stone_id):
+            return False
+        self.history.push(MOVE_PLACE, player_index, row, col, stone_id)
+        return True
+
+    def use_observation(self, player_index: int) -> bool:
+        """
+        観測回数を1消費し、履歴に記録します。
+
+        Args:
+            player_index (int): 観測するプレイヤーのインデックス。
+
+        Returns:
+            bool: 観測回数が残っていればTrue。
+        """
+        if not self._make(MOVE_OBSERVE, player_index):
+            return False
+        self.history.push(MOVE_OBSERVE, player_index)
+        return True
+
+    def undo(self) -> bool:
+        """
+        1手戻します（待った）。
+
+        Returns:
+            bool: 戻せた場合はTrue。
+        """
+        node = self.history.undo()
+        if node is None:
+            return False
+        self._unmake(node)
+        return True
+
+    def redo(self) -> bool:
+        """
+        戻した手を1手進めます。
+
+        Returns:
+            bool: 進めた場合はTrue。
+        """
+        node = self.history.redo()
+        if node is None:
+            return False
+        if not self._make(node.kind, node.player_index, node.row, node.col, node.stone_id):
+            self.history.current = node.parent
+            return False
+        return True
+
+    def _make(self, kind: int, player_index: int,
+              row: int = -1, col: int = -1, stone_id: int = 0) -> bool:
+        """手を盤面とプレイヤーに反映します。反映できなければ何も変更しません。"""
+        player = self.players[player_index]
+        if kind == MOVE_PLACE:
+            if not self.board.place_stone(row, col, stone_id):
+                return False
+            player.confirm_placement()
+            self.current_player_index = 1 - player_index
+        elif kind == MOVE_OBSERVE:
+            if not player.can_observe():
+                return False
+            player.use_observation()
+        return True
+
+    def _unmake(self, node: MoveNode):
+        """手の反映を取り消します。"""
+        player = self.players[node.player_index]
+        if node.kind == MOVE_PLACE:
+            self.board.remove_stone(node.row, node.col)
+            player.undo_placement()
+            self.current_player_index = node.player_index
+        elif node.kind == MOVE_OBSERVE:
+            player.restore_observation()
@@ -0,0 +1,125 @@
+from typing import Optional
+
+# 手の種類
+MOVE_PLACE = 0    # 石を置く
+MOVE_OBSERVE = 1  # 観測回数を消費する
+
+class MoveNode:
+    """
+    手順木の1手を表すノード。
+
+    親と子の双方向のリンクを持つ可変の木で、分岐した変化同士は
+    共通の手順のノードを共有します。last_child は最後に選んだ変化を指し、
+    やり直しで辿る先になります。
+    """
+    __slots__ = ("parent", "children", "last_child", "kind",
+                 "row", "col", "stone_id", "player_index", "depth")
+
+    def __init__(self, parent: Optional["MoveNode"], kind: int, player_index: int,
+                 row: int = -1, col: int = -1, stone_id: int = 0):
+        """
+        Args:
+            parent (Optional[MoveNode]): 直前の手。根ならNone。
+            kind (int): 手の種類 (MOVE_PLACE or MOVE_OBSERVE)。
+            player_index (int): 手を指したプレイヤーのインデックス。
+            row (int): 石を置いた行。
+            col (int): 石を置いた列。
+            stone_id (int): 置いた石のID。
+        """
+        self.parent = parent
+        self.children = []
+        self.last_child = None
+        self.kind = kind
+        self.row = row
+        self.col = col
+        self.stone_id = stone_id
+        self.player_index = player_index
+        self.depth = parent.depth + 1 if parent is not None else 0
+
+    def same_move(self, kind: int, player_index: int, row: int, col: int, stone_id: int) -> bool:
+        """同じ手かどうかを判定します。"""
+        return (self.kind == kind and self.player_index == player_index and
+                self.row == row and self.col == col and self.stone_id == stone_id)
+
+
+class MoveHistory:
+    """
+    手順の履歴（手順木）を管理するクラス。
+
+    戻す・進めるはO(1)、記録は既存の変化を探すため分岐数に比例します。
+    盤面のコピーは行わず、盤面やプレイヤーへの反映は GameState が
+    差分として適用します。
+    """
+    def __init__(self):
+        self.root = MoveNode(None, MOVE_PLACE, -1)
+        self.current = self.root
+
+    def push(self, kind: int, player_index: int,
+             row: int = -1, col: int = -1, stone_id: int = 0) -> MoveNode:
+        """
+        現在の局面に手を追加し、その手へ進みます。
+
+        既に同じ手の変化があればそれを再利用し、なければ新しい分岐を作ります。
+
+        Returns:
+            MoveNode: 追加（または再利用）した手。
+        """
+        node = None
+        for child in self.current.children:
+            if child.same_move(kind, player_index, row, col, stone_id):
+                node = child
+                break
+        if node is None:
+            node = MoveNode(self.current, kind, player_index, row, col, stone_id)
+            self.current.children.append(node)
+        self.current.last_child = node
+        self.current = node
+        return node
+
+    def undo(self) -> Optional[MoveNode]:
+        """
+        1手戻します。
+
+        Returns:
+            Optional[MoveNode]: 取り消した手。戻せなければNone。
+        """
+        node = self.current
+        if node.parent is None:
+            return None
+        self.current = node.parent
+        return node
+
+    def redo(self) -> Optional[MoveNode]:
+        """
+        最後に選んだ変化に沿って1手進めます。
+
+        Returns:
+            Optional[MoveNode]: 再適用する手。進められなければNone。
+        """
+        node = self.current.last_child
+        if node is None:
+            return None
+        self.current = node
+        return node
+
+    def can_undo(self) -> bool:
+        """戻せる手があればTrue。"""
+        return self.current.parent is not None
+
+    def can_redo(self) -> bool:
+        """進められる手があればTrue。"""
+        return self.current.last_child is not None
+
+    def move_count(self) -> int:
+        """現在の局面までの手数を返します。"""
+        return self.current.depth
+
+    def moves(self) -> list[MoveNode]:
+        """根から現在の局面までの手順を返します。"""
+        line = []
+        node = self.current
+        while node.parent is not None:
+            line.append(node)
+            node = node.parent
+        line.reverse()
+        return line
@@ -5,8 +5,8 @@ from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, WINDOW_TITLE, BOARD_OFFSET, GRID_SIZE,
     BOARD_SIZE, CUSTOM_COLORS, PLAYER_BLACK, PLAYER_WHITE
 )
-from board import Board
-from player import Player
+from game import GameState
+from history import MOVE_OBSERVE
 
 class App:
     """
@@ -39,13 +39,14 @@ class App:
         ゲームの状態を初期化またはリセットします。
         """
         self.game_state = "playing"  # playing, observing, game_over
-        self.board = Board()
-        self.players = [Player(PLAYER_BLACK), Player(PLAYER_WHITE)]
-        self.current_player_index = 0
+        self.game = GameState()
+        self.board = self.game.board
+        self.players = self.game.players
         self.winner = None
         self.message = ""
         self.message_timer = 0
         self.observer_index = None
+        self.is_observing = False
 
     def update(self):
         """
@@ -72,30 +73,39 @@ class App:
 
     def update_playing(self):
         """プレイ中の更新処理"""
-        current_player = self.players[self.current_player_index]
-
-        # 石を置く処理
-        if pyxel.btnp(pyxel.MOUSE_BUTTON_LEFT):
+        # 待った・やり直し（観測中は元の盤面に戻してから）
+        if not self.is_observing:
+            if pyxel.btnp(pyxel.KEY_Z):
+                # 観測結果はランダムなので、観測の手は待ったで戻せない
+                if self.game.history.current.kind != MOVE_OBSERVE:
+                    self.game.undo()
+                return
+            if pyxel.btnp(pyxel.KEY_Y):
+                self.game.redo()
+                return
+
+        # 石を置く処理（観測中は置けない）
+        if pyxel.btnp(pyxel.MOUSE_BUTTON_LEFT) and not self.is_observing:
             row, col = self.xy_to_grid(pyxel.mouse_x, pyxel.mouse_y)
             if row is not None:
-                stone_id = current_player.get_next_stone_id()
-                if self.board.place_stone(row, col, stone_id):
-                    current_player.confirm_placement()
-                    self.current_player_index = 1 - self.current_player_index
+                self.game.place_stone(row, col)
 
         # 観測処理
         if pyxel.btnp(pyxel.KEY_O):
             if not self.is_observing:
+                if not self.game.use_observation(self.game.current_player_index):
+                    self.message = "NO OBSERVATIONS LEFT"
+                    self.message_timer = 60
+                    return
                 self.board.save_grid()
                 self.is_observing = True
-                self.observer_index = self.current_player_index  # 観測者を記録
+                self.observer_index = self.game.current_player_index  # 観測者を記録
                 self.message = "OBSERVING... (Press O again to restore)"
                 self.message_timer = 0
 
                 # 観測後の勝利判定（確定色で判定！）
                 observer_player_type = [PLAYER_BLACK, PLAYER_WHITE][self.observer_index]
                 winner = self.board.observe_and_check_winner(observer_player_type)
-                self.players[self.observer_index].observation_count -= 1
 
                 if winner is not None:
                     self.winner = winner
@@ -148,7 +158,7 @@ class App:
         ui_y = 20
 
         # 現在のプレイヤー
-        turn_player_index = self.current_player_index
+        turn_player_index = self.game.current_player_index
         turn_player_obj = self.players[turn_player_index]
         if turn_player_index == 0:
             player_text = "BLACK TURN"
@@ -170,8 +180,10 @@ class App:
         # 操作説明
         pyxel.text(ui_x, ui_y + 90, "L-CLICK: PLACE STONE", 7)
         pyxel.text(ui_x, ui_y + 100, "'O' KEY: OBSERVE", 7)
+        pyxel.text(ui_x, ui_y + 110, "'Z' KEY: UNDO  'Y' KEY: REDO", 7)
+        pyxel.text(ui_x, ui_y + 120, f"MOVE: {self.game.history.move_count()}", 7)
         if self.game_state == "game_over":
-            pyxel.text(ui_x, ui_y + 120, "'R' KEY: RESTART", 7)
+            pyxel.text(ui_x, ui_y + 140, "'R' KEY: RESTART", 7)
 
 
     def xy_to_grid(self, x, y):
@@ -39,6 +39,12 @@ class Player:
         """
         self.next_stone_index = 1 - self.next_stone_index
 
+    def undo_placement(self):
+        """
+        石の配置を取り消し、次に使う石を元に戻します。
+        """
+        self.next_stone_index = 1 - self.next_stone_index
+
     def can_observe(self) -> bool:
         """
         観測が実行可能かを確認します。
@@ -53,4 +59,10 @@ class Player:
         観測回数を1消費します。
         """
         if self.can_observe():
-            self.observation_count -= 1
\ No newline at end of file
+            self.observation_count -= 1
+
+    def restore_observation(self):
+        """
+        消費した観測回数を1戻します。
+        """
+        self.observation_count += 1
\ No newline at end of file
@@ -0,0 +1,11 @@
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 描画以外のテストでは pyxel を使わないので、未インストールなら空のモジュールで代用する
+try:
+    import pyxel  # noqa: F401
+except ImportError:
+    sys.modules["pyxel"] = types.ModuleType("pyxel")
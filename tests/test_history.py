@@ -0,0 +1,102 @@
+from game import GameState
+from history import MoveHistory, MOVE_PLACE
+
+
+def test_undo_at_root_returns_none():
+    history = MoveHistory()
+    assert history.undo() is None
+    history.push(MOVE_PLACE, 0, 7, 7, 1)
+    assert history.undo() is not None
+    assert history.undo() is None
+    assert history.move_count() == 0
+
+
+def test_redo_follows_last_chosen_branch():
+    history = MoveHistory()
+    history.push(MOVE_PLACE, 0, 7, 7, 1)
+    history.undo()
+    second = history.push(MOVE_PLACE, 0, 3, 3, 1)
+    history.undo()
+    assert history.redo() is second
+    assert len(history.root.children) == 2
+
+
+def test_push_identical_move_reuses_child():
+    history = MoveHistory()
+    first = history.push(MOVE_PLACE, 0, 7, 7, 1)
+    history.undo()
+    assert history.push(MOVE_PLACE, 0, 7, 7, 1) is first
+    assert len(history.root.children) == 1
+
+
+def _snapshot(game):
+    grid = [[stone.id if stone else None for stone in row] for row in game.board.grid]
+    players = [(p.next_stone_index, p.observation_count) for p in game.players]
+    return grid, players, game.current_player_index
+
+
+def test_undo_redo_round_trip_restores_state():
+    game = GameState()
+    initial = _snapshot(game)
+    game.place_stone(0, 0)
+    assert game.use_observation(1)
+    for row, col in [(1, 1), (2, 2), (3, 3), (4, 4)]:
+        assert game.place_stone(row, col)
+    assert not game.place_stone(1, 1)
+
+    end = _snapshot(game)
+    count = game.history.move_count()
+    for _ in range(count):
+        assert game.undo()
+    assert not game.undo()
+    assert _snapshot(game) == initial
+    for _ in range(count):
+        assert game.redo()
+    assert not game.redo()
+    assert _snapshot(game) == end
+
+
+def test_observation_round_trip():
+    game = GameState()
+    game.place_stone(7, 7)
+    before = _snapshot(game)
+    assert game.use_observation(1)
+    assert game.players[1].observation_count == before[1][1][1] - 1
+    assert game.undo()
+    assert _snapshot(game) == before
+    assert game.redo()
+    assert game.players[1].observation_count == before[1][1][1] - 1
+
+
+def test_branch_then_redo_restores_stone_and_turn():
+    game = GameState()
+    game.place_stone(0, 0)
+    game.place_stone(1, 1)
+    white_stone = game.board.grid[1][1].id
+    assert game.undo()
+    assert game.undo()
+    assert game.current_player_index == 0
+    assert game.place_stone(2, 2)
+    black_stone = game.board.grid[2][2].id
+    assert game.undo()
+    assert game.board.grid[2][2] is None
+
+    assert game.redo()
+    assert game.board.grid[2][2].id == black_stone
+    assert game.board.grid[0][0] is None
+    assert game.current_player_index == 1
+    assert game.place_stone(1, 1)
+    assert game.board.grid[1][1].id == white_stone
+    assert game.current_player_index == 0
+    assert len(game.history.root.children) == 2
+
+
+def test_failed_redo_leaves_cursor_unchanged():
+    game = GameState()
+    game.place_stone(0, 0)
+    assert game.undo()
+    game.board.place_stone(0, 0, 4)
+    assert not game.redo()
+    assert game.history.current is game.history.root
+    assert game.players[0].next_stone_index == 0
+    assert game.current_player_index == 0